@@ -1,11 +1,11 @@
 from .thermodynamics_recfast import compute_thermo as compute_thermo_recfast, evaluate_thermo as evaluate_thermo_recfast
 from .thermodynamics_mb95 import compute_thermo as compute_thermo_mb95
-from .cosmo import nu_background
+from .cosmo import nu_background_vmap, integrate_trapz
+from .util import UniformCubicInterpolation
 import jax
 import jax.numpy as jnp
 import diffrax as drx
 import equinox as eqx
-from jax_cosmo.scipy.integrate import romb
 from functools import partial
 from typing import Union
 
@@ -14,16 +14,34 @@ def a_of_tau(tau_: Union[float, jax.Array], param: dict) -> Union[float, jax.Arr
     a, _, _, _ = param['sol'].evaluate(tau_)
     return a
 
-def dtauda_(a, grhom, grhog, grhor, Omegam, OmegaDE, w_DE_0, w_DE_a, Omegak, Neff, Nmnu, logrhonu_spline):
-    """Derivative of conformal time with respect to scale factor"""
+def dtauda_(a, grhom, grhog, grhor, Omegam, OmegaDE, w_DE_0, w_DE_a, Omegak, Neff, Nmnu, rhonu):
+    """Derivative of conformal time with respect to scale factor, given rhonu tabulated at a"""
     rho_DE = a**(-3*(1+w_DE_0+w_DE_a)) * jnp.exp(3*(a-1)*w_DE_a)
-    grho2 = grhom * Omegam * a \
-        + (grhog + grhor*(Neff+Nmnu*jnp.exp(logrhonu_spline.evaluate(jnp.log(a))))) \
-        + grhom * OmegaDE * rho_DE * a**4 \
-        + grhom * Omegak * a**2
+    grho2 = grhom * (Omegam * a + OmegaDE * rho_DE * a**4 + Omegak * a**2) \
+        + grhog + grhor*(Neff+Nmnu*rhonu)
     return jnp.sqrt(3.0 / grho2)
 
 
+@partial(jax.jit, static_argnames=('num',))
+def compute_neutrino_tables( amin, amax, amnu, num : int ):
+    """Tabulate the density, pressure and pseudo-pressure of one flavour of massive 
+       neutrinos on a grid uniformly spaced in log(a). Only the table size is static, 
+       so the compiled function is reused for all cosmologies.
+
+    Args:
+        amin (float): smallest scale factor
+        amax (float): largest scale factor
+        amnu (float): neutrino mass in units of neutrino temperature (m_nu*c**2/(k_B*T_nu0).
+        num (int): number of grid points
+
+    Returns:
+        tuple[jax.Array, jax.Array, jax.Array, jax.Array]: a, rho_nu/rho_nu0, p_nu/p_nu0, pp_nu/p_nu0
+    """
+    a = jnp.geomspace(amin, amax, num)
+    rhonu, pnu, ppnu = nu_background_vmap( a, amnu )
+    return a, rhonu, pnu, ppnu
+
+
 @partial(jax.jit, static_argnames=('thermo_module',))
 def evolve_background( *, param, thermo_module = 'RECFAST', rtol: float = 1e-5, atol: float = 1e-7, order: int = 5, class_thermo = None ):
     c2ok = 1.62581581e4 # K / eV
@@ -51,22 +69,20 @@ def evolve_background( *, param, thermo_module = 'RECFAST', rtol: float = 1e-5,
         amax = jnp.max( class_thermo['scale factor a'] )
 
     
-    # Compute the scale factor linearly spaced in log(a)
-    a = jnp.geomspace(amin, amax, num_neutrino)
+    # Compute the neutrino density and pressure on a grid linearly spaced in log(a)
+    a, rhonu_, pnu_, ppnu_ = compute_neutrino_tables( amin, amax, param['amnu'], num=num_neutrino )
     loga = jnp.log(a)
     param['a'] = a
 
-    # Compute the neutrino density and pressure
-    rhonu_, pnu_, ppnu_ = jax.vmap( lambda a_ : nu_background( a_, param['amnu'] ), in_axes=0 )( a )
-
     rhonu_coeff = drx.backward_hermite_coefficients(ts=loga, ys=jnp.log(rhonu_))
     pnu_coeff = drx.backward_hermite_coefficients(ts=loga, ys=jnp.log(pnu_))
     ppnu_coeff = drx.backward_hermite_coefficients(ts=loga, ys=jnp.log(ppnu_))
-    rhonu_spline = drx.CubicInterpolation( ts=loga, coeffs=rhonu_coeff )
+    # the tables are uniformly spaced in log(a), so interval lookup is O(1)
+    rhonu_spline = UniformCubicInterpolation( ts=loga, coeffs=rhonu_coeff )
     
     param['logrhonu_of_loga_spline']     = rhonu_spline
-    param['logpnu_of_loga_spline']       = drx.CubicInterpolation( ts=loga, coeffs=pnu_coeff )
-    param['logppseudonu_of_loga_spline'] = drx.CubicInterpolation( ts=loga, coeffs=ppnu_coeff )
+    param['logpnu_of_loga_spline']       = UniformCubicInterpolation( ts=loga, coeffs=pnu_coeff )
+    param['logppseudonu_of_loga_spline'] = UniformCubicInterpolation( ts=loga, coeffs=ppnu_coeff )
 
     # compute the energy density today due to massive neutrinos
     rhonu = jnp.exp(param['logrhonu_of_loga_spline'].evaluate(0.0))
@@ -80,10 +96,12 @@ def evolve_background( *, param, thermo_module = 'RECFAST', rtol: float = 1e-5,
 
     # Compute the conformal time interval
     param['taumin'] = amin / param['adotrad']
-    param['taumax'] = param['taumin'] + romb( lambda a_: dtauda_(a_,param['grhom'], param['grhog'], param['grhor'], 
-                                                                 param['Omegam'], param['OmegaDE'], param['w_DE_0'], param['w_DE_a'],
-                                                                 param['Omegak'], param['Neff'], param['Nmnu'], 
-                                                                 param['logrhonu_of_loga_spline']), amin, amax )
+    # integrate dtau = a * dtauda dloga with the trapezoidal rule on the uniform 
+    # log(a) grid of the neutrino tables, reusing the tabulated rhonu
+    dtauda_tab = dtauda_(a, param['grhom'], param['grhog'], param['grhor'], 
+                         param['Omegam'], param['OmegaDE'], param['w_DE_0'], param['w_DE_a'],
+                         param['Omegak'], param['Neff'], param['Nmnu'], rhonu_)
+    param['taumax'] = param['taumin'] + integrate_trapz( a * dtauda_tab, loga )
 
     
     if thermo_module == 'RECFAST':
@@ -1,6 +1,7 @@
 import jax
 import jax.numpy as jnp
-import jax_cosmo.scipy.interpolate as jaxinterp
+import numpy as np
+from functools import partial, lru_cache
 
 
 # the trapz integration has been moved from jnp to jax.scipy
@@ -11,97 +12,103 @@ else:
   integrate_trapz = jax.scipy.integrate.trapezoid
 
 
-# @partial( jax.jit, static_argnames=('nqmax',) )
-def get_neutrino_momentum_bins(  nqmax : int ) -> tuple[jax.Array, jax.Array]:
-    """Get the momentum bins and integral kernel weights for neutrinos
-
-    Args:
-        nqmax (int): Number of momentum bins.
-
-    Returns:
-        jax.Array: q, w
-    """
+@lru_cache(maxsize=None)
+def _neutrino_momentum_bins( nqmax : int ) -> tuple[np.ndarray, np.ndarray]:
+    """Momentum bins and weights as host-side constants, computed once per nqmax"""
     # fermi_dirac_const = 7 * np.pi**4 / 120
     fermi_dirac_const = 5.682196976983475
 
     if nqmax == 3:
-        q = jnp.array([0.913201, 3.37517, 7.79184])
-        w = jnp.array([0.0687359, 3.31435, 2.29911])
+        q = np.array([0.913201, 3.37517, 7.79184])
+        w = np.array([0.0687359, 3.31435, 2.29911])
     elif nqmax == 4:
-        q = jnp.array([0.7, 2.62814, 5.90428, 12.0])
-        w = jnp.array([0.0200251, 1.84539, 3.52736, 0.289427])
+        q = np.array([0.7, 2.62814, 5.90428, 12.0])
+        w = np.array([0.0200251, 1.84539, 3.52736, 0.289427])
     elif nqmax == 5:
-        q = jnp.array([0.583165, 2.0, 4.0, 7.26582, 13.0])
-        w = jnp.array([0.0081201, 0.689407, 2.8063, 2.05156, 0.12681])
+        q = np.array([0.583165, 2.0, 4.0, 7.26582, 13.0])
+        w = np.array([0.0081201, 0.689407, 2.8063, 2.05156, 0.12681])
     else:
         dq = (12 + nqmax/5)/nqmax
-        q = (jnp.arange(1, nqmax + 1) - 0.5) * dq
-        dlfdlq = -q/(1+jnp.exp(-q))
-        w = dq * q**3 / (jnp.exp(q) + 1) * (-0.25*dlfdlq)
-    dlfdlq = -q/(1+jnp.exp(-q))  #TODO: recompute the coefficients without the dlfdlq factor from CAMB
-    w /= (-0.25*dlfdlq)
-    return q, w / fermi_dirac_const 
+        q = (np.arange(1, nqmax + 1) - 0.5) * dq
+        dlfdlq = -q/(1+np.exp(-q))
+        w = dq * q**3 / (np.exp(q) + 1) * (-0.25*dlfdlq)
+    dlfdlq = -q/(1+np.exp(-q))  #TODO: recompute the coefficients without the dlfdlq factor from CAMB
+    w = w / (-0.25*dlfdlq) / fermi_dirac_const
+    q.flags.writeable = False
+    w.flags.writeable = False
+    return q, w
 
-# @jax.jit
-def nu_background( a : float, amnu: float, nq : int = 1000 ) -> tuple[float, float]:
+
+def get_neutrino_momentum_bins(  nqmax : int ) -> tuple[jax.Array, jax.Array]:
+    """Get the momentum bins and integral kernel weights for neutrinos
+
+    Args:
+        nqmax (int): Number of momentum bins.
+
+    Returns:
+        jax.Array: q, w
+    """
+    q, w = _neutrino_momentum_bins( nqmax )
+    return jnp.asarray(q), jnp.asarray(w)
+
+
+@lru_cache(maxsize=None)
+def _nu_background_grid( nq : int ) -> tuple[np.ndarray, np.ndarray]:
+    """Gauss-Laguerre nodes q and weights wq for integrals against the Fermi-Dirac 
+       kernel q**3/(exp(q)+1) used by nu_background, computed once per nq so they 
+       enter traces as constants"""
+    # q**3/(exp(q)+1) = exp(-q) * q**3/(1+exp(-q)), absorb everything but exp(-q) 
+    # into the Gauss-Laguerre weights
+    q, wk = np.polynomial.laguerre.laggauss( nq )
+    wq   = wk * q**3 / (1 + np.exp(-q))
+    q.flags.writeable = False
+    wq.flags.writeable = False
+    return q, wq
+
+@partial(jax.jit, static_argnames=('nq',))
+def nu_background( a : float, amnu: float, nq : int = 64 ) -> tuple[float, float]:
     """ computes the neutrino density and pressure of one flavour of massive neutrinos
         in units of the mean density of one flavour of massless neutrinos
 
     Args:
         a (float): scale factor
         amnu (float): neutrino mass in units of neutrino temperature (m_nu*c**2/(k_B*T_nu0).
-        nq (int, optional): number of integration points. Defaults to 1000.
-        qmax (float, optional): maximum momentum. Defaults to 30..
+        nq (int, optional): number of Gauss-Laguerre integration points. Defaults to 64.
 
     Returns:
         tuple[float, float]: rho_nu/rho_nu0, p_nu/p_nu0
     """
-    qmax = (12 + nq/10)
-
     # const = 7 * np.pi**4 / 120
     const = 5.682196976983475
     
-    # q is the comoving momentum in units of k_B*T_nu0/c.
-    # Integrate up to qmax and then use asymptotic expansion for remainder.
-    dq   = qmax / nq
-    q    = dq * jnp.arange(1,nq+1)
-    aq   = a * amnu / q
-    v    = 1 / jnp.sqrt(1 + aq**2)   # = (1/aq) / sqrt(1+1/aq**2)
-    qdn  = dq * q**3 / (jnp.exp(q) + 1)
-    dum1 = qdn / v
-    dum2 = qdn * v
-    dum3 = qdn * v**3
-    
-    rho_spline = jaxinterp.InterpolatedUnivariateSpline(q, dum1)
-    rhonu = rho_spline.integral(0, qmax)[0]
-    p_spline = jaxinterp.InterpolatedUnivariateSpline(q, dum2)
-    pnu = p_spline.integral(0, qmax)[0]
-    pp_spline = jaxinterp.InterpolatedUnivariateSpline(q, dum3)
-    ppnu = pp_spline.integral(0, qmax)[0]
-
-    # Apply asymptotic corrrection for q>qmax and normalize by relativistic
-    # energy density.
-    # rhonu = (rhonu / dq + dum1[-1] / dq) / const
-    # pnu = (pnu / dq + dum2[-1] / dq) / const / 3
-    # ppnu = (ppnu / dq + dum3[-1] / dq) / const / 3
-    rhonu = rhonu / dq / const
-    pnu = pnu / dq / const / 3
-    ppnu = ppnu / dq / const / 3
+    # q is the comoving momentum in units of k_B*T_nu0/c, integrated over [0,inf)
+    q, wq = _nu_background_grid( nq )
+    # s = 1/v = sqrt(1 + (a*amnu/q)**2), with v the neutrino velocity; the 
+    # three integrals are single elementwise-and-reduce passes over the grid
+    aq    = a * amnu / q
+    s2    = 1 + aq * aq
+    inv_s = jax.lax.rsqrt(s2)
+    s     = s2 * inv_s
+    rhonu = jnp.sum(wq * s) / const
+    pnu   = jnp.sum(wq * inv_s) / const / 3
+    ppnu  = jnp.sum(wq * inv_s**3) / const / 3
     
     return rhonu, pnu, ppnu
 
+# nu_background vectorised over the scale factor for a single neutrino mass, 
+# defined once at module level so that all callers share one compiled kernel
+nu_background_vmap = jax.jit( jax.vmap( nu_background, in_axes=(0, None) ) )
+
 
 # @partial(jax.jit, static_argnames=("params",))
 # @jax.jit
 def dtauda_(a, grhom, grhog, grhor, Omegam, OmegaDE, w_DE_0, w_DE_a, Omegak, Neff, Nmnu, amnu):
     """Derivative of conformal time with respect to scale factor"""
     # jax.debug.print( 'a={} amnu={}',a, amnu)
-    rhonu = jax.vmap( lambda aa: nu_background(aa,amnu)[0] )( jnp.atleast_1d(a) )
+    rhonu = nu_background_vmap( jnp.atleast_1d(a), amnu )[0]
     rho_DE = a**(-3*(1+w_DE_0+w_DE_a)) * jnp.exp(3*(a-1)*w_DE_a)
-    grho2 = grhom * Omegam * a \
-        + (grhog + grhor*(Neff+Nmnu*rhonu)) \
-        + grhom * OmegaDE * rho_DE * a**4 \
-        + grhom * Omegak * a**2
+    grho2 = grhom * (Omegam * a + OmegaDE * rho_DE * a**4 + Omegak * a**2) \
+        + grhog + grhor*(Neff+Nmnu*rhonu)
     return jnp.sqrt(3.0 / grho2).reshape( jnp.asarray(a).shape )
 
 def dadtau(a, param ):
@@ -110,10 +117,8 @@ def dadtau(a, param ):
     rhonu = jnp.exp(param['logrhonu_of_loga_spline'].evaluate(jnp.log(a)))
 
     rho_DE = a**(-3*(1+param['w_DE_0']+param['w_DE_a'])) * jnp.exp(3*(a-1)*param['w_DE_a'])
-    grho2 = param['grhom'] * param['Omegam'] * a \
-        + (param['grhog'] + param['grhor']*(param['Neff']+param['Nmnu']*rhonu)) \
-        + param['grhom'] * param['OmegaDE'] * rho_DE * a**4 \
-        + param['grhom'] * param['Omegak'] * a**2
+    grho2 = param['grhom'] * (param['Omegam'] * a + param['OmegaDE'] * rho_DE * a**4 + param['Omegak'] * a**2) \
+        + param['grhog'] + param['grhor']*(param['Neff']+param['Nmnu']*rhonu)
     return jnp.sqrt(grho2 / 3.0).reshape( jnp.asarray(a).shape )
 
 def dtauda(a, param ):
@@ -12,7 +12,7 @@ from functools import partial
 import jax.flatten_util as fu
 
 
-# @partial( jax.jit, static_argnames=('nqmax0',) )
+@partial( jax.jit, static_argnames=('nqmax',) )
 def nu_perturb( a : float, amnu: float, psi0: jax.Array, psi1 : jax.Array, psi2 : jax.Array, nqmax : int ) -> tuple[jax.Array, jax.Array, jax.Array, jax.Array]:
     """ Compute the perturbations of density, energy flux, pressure, and
         shear stress of one flavor of massive neutrinos, in units of the mean
@@ -34,12 +34,12 @@ def nu_perturb( a : float, amnu: float, psi0: jax.Array, psi1 : jax.Array, psi2
     
     q, w = get_neutrino_momentum_bins( nqmax )
     aq = a * amnu / q
-    v = 1 / jnp.sqrt(1 + aq**2)
+    v2inv = 1 + aq * aq
+    v = jax.lax.rsqrt(v2inv)
 
-    drhonu = jnp.sum(w * psi0 / v)
-    dpnu = jnp.sum(w * psi0 * v) / 3
-    fnu = jnp.sum(w * psi1) 
-    shearnu = jnp.sum(w * psi2 * v) * 2 / 3
+    # all four moments share the quadrature weights, integrate them in one pass
+    G = jnp.stack([psi0 * v2inv * v, psi0 * v, psi1, psi2 * v])
+    drhonu, dpnu, fnu, shearnu = (G @ w) * jnp.array([1.0, 1.0/3.0, 1.0, 2.0/3.0])
 
     return drhonu, dpnu, fnu, shearnu
 
@@ -135,8 +135,9 @@ def model_synchronous(*, tau, y, param, kmode, lmaxg, lmaxgp, lmaxr, lmaxnu, nqm
     # cs2     = param['cs2a_of_tau_spline'].evaluate( tau ) / a
     # xe      = param['xe_of_tau_spline'].evaluate( tau )
 
-    cs2     = param['cs2a_of_tau_spline'].evaluate( param['tau_of_a_spline'].evaluate( a ) ) / a
-    xe      = param['xe_of_tau_spline'].evaluate( param['tau_of_a_spline'].evaluate( a ) )
+    tau_a   = param['tau_of_a_spline'].evaluate( a )
+    cs2     = param['cs2a_of_tau_spline'].evaluate( tau_a ) / a
+    xe      = param['xe_of_tau_spline'].evaluate( tau_a )
     
     # ... Photon mass density over baryon mass density
     photbar = param['grhog'] / (param['grhom'] * param['Omegab'] * a)
@@ -295,31 +296,27 @@ def model_synchronous(*, tau, y, param, kmode, lmaxg, lmaxgp, lmaxr, lmaxnu, nqm
     v = 1 / jnp.sqrt(1 + aq**2)
     dlfdlq = -q / (1.0 + jnp.exp(-q))  # derivative of the Fermi-Dirac distribution
 
-    f = f.at[iq0 : iq1].set(
-        -kmode * v * y[iq1 : iq2] + hprime* dlfdlq / 6.0 
-    )
-    f = f.at[iq1 : iq2].set(
-        kmode * v * (y[iq0 : iq1] - 2.0 * y[iq2 : iq3]) / 3.0
-    )
-    f = f.at[iq2 : iq3].set(
-        kmode * v * (2 * y[iq1 : iq2] - 3 * y[iq3 : iq4]) / 5.0 - (hprime / 15 + 2 / 5 * etaprime) * dlfdlq
-    )
-
+    # the massive neutrino moments l=0..lmaxnu are contiguous in y, assemble them 
+    # directly and write them into f in one go
     ell = jnp.arange(3, lmaxnu)
     vv = jnp.tile(v, lmaxnu - 3)
     denl = jnp.repeat( 2*ell+1, nqmax )
 
-    f = f.at[iq0 + 3 * nqmax : iq0 + lmaxnu * nqmax].set(
+    f = f.at[iq0 : -2].set( jnp.concatenate([
+        # l = 0
+        -kmode * v * y[iq1 : iq2] + hprime* dlfdlq / 6.0,
+        # l = 1
+        kmode * v * (y[iq0 : iq1] - 2.0 * y[iq2 : iq3]) / 3.0,
+        # l = 2
+        kmode * v * (2 * y[iq1 : iq2] - 3 * y[iq3 : iq4]) / 5.0 - (hprime / 15 + 2 / 5 * etaprime) * dlfdlq,
+        # 3 <= l < lmaxnu
         kmode * vv / denl * (
             jnp.repeat( ell, nqmax ) * y[iq0 + 2*nqmax : iq0 + (lmaxnu-1)*nqmax] 
             - jnp.repeat( ell+1, nqmax ) * y[iq0 + 4*nqmax : iq0 + (lmaxnu+1)*nqmax]
-        ) 
-    )
-
-    # Truncate moment expansion.
-    f = f.at[-nqmax-2 :-2].set(
-        kmode * v * y[-2 * nqmax-2 : -nqmax-2] - (lmaxnu + 1) / tau * y[-nqmax-2 :-2]
-    )
+        ),
+        # Truncate moment expansion.
+        kmode * v * y[-2 * nqmax-2 : -nqmax-2] - (lmaxnu + 1) / tau * y[-nqmax-2 :-2],
+    ]) )
 
     # ---- Quintessence equations of motion -----------------------------------------------------------
     # ... Ballesteros & Lesgourgues (2010, BL10), arXiv:1004.5509
@@ -210,11 +210,7 @@ def model_recfast( *, tau : float, yin : jnp.array, param : dict ) -> jnp.array:
   daTdtau = jax.lax.cond( a < 1e-5, lambda x: 0.0, lambda x: daTdtau, None )
   # daTdtau = jax.lax.cond( a < 1e-6, lambda x: a**2 * compton_term * (TR - TM), lambda x: daTdtau, None )
 
-  fvec = jnp.zeros(4)
-  fvec = fvec.at[0].set( dlogadtau )
-  fvec = fvec.at[1].set( dxHepdtau )
-  fvec = fvec.at[2].set( dxpdtau )
-  fvec = fvec.at[3].set( daTdtau )
+  fvec = jnp.array([ dlogadtau, dxHepdtau, dxpdtau, daTdtau ])
 
   # limit xHep to 1e-7 to avoid numerical problems
   # fvec = fvec.at[1].set( jax.lax.cond( jnp.abs(xHep) < 1e-6, lambda x: (1e-7-xHep)/tau, lambda x: fvec[1], None ) )
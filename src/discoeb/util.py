@@ -1,5 +1,6 @@
 import jax
 import jax.numpy as jnp
+import diffrax as drx
 
 def lngamma_complex_e( z : complex ):
   """Log[Gamma(z)] for z complex, z not a negative integer Uses complex Lanczos method. Note that the phase part (arg)
@@ -50,6 +51,8 @@ def root_find_bisect( *, func, xleft, xright, numit, param ):
     Right boundary of the interval.
   numit : int
     Number of iterations.
+  param : any
+    Extra argument passed through to func.
 
   Returns
   -------
@@ -57,16 +60,16 @@ def root_find_bisect( *, func, xleft, xright, numit, param ):
     Approximation to the root, given by the midpoint of the final interval.
 
   """
-  for i in range(numit):
-        xmid = 0.5 * (xleft + xright)
-        xleft, xright = jax.lax.cond(func(xmid, param) * func(xleft, param) > 0, lambda x : (xmid, xright), lambda x : (xleft, xmid), None )
-  # def body(carry, i):
-  #   xleft, xright, param = carry
-  #   xmid = 0.5 * (xleft + xright)
-  #   carry = jax.lax.cond(func(xmid, param) * func(xleft, param) > 0, lambda x : (xmid, xright, param), lambda x : (xleft, xmid, param), None )
-  #   return carry, xmid
-
-  # (xleft, xright, param), _ = jax.lax.scan(body, (xleft, xright, param), jnp.arange(numit))
+  # carry f(xleft) along so that each iteration evaluates func only once, the
+  # scan lowers to a single loop independent of numit
+  def body(carry, _):
+    xleft, xright, fleft = carry
+    xmid = 0.5 * (xleft + xright)
+    fmid = func(xmid, param)
+    carry = jax.lax.cond(fmid * fleft > 0, lambda x : (xmid, xright, fmid), lambda x : (xleft, xmid, fleft), None )
+    return carry, None
+
+  (xleft, xright, _), _ = jax.lax.scan(body, (xleft, xright, func(xleft, param)), None, length=numit)
   return 0.5 * (xleft + xright)
 
 
@@ -116,3 +119,18 @@ def savgol_filter( *, y : jax.Array, window_length : int, polyorder : int ) -> j
   coeffs, _, _, _ = jnp.linalg.lstsq(A, Y)
 
   return jnp.convolve(y,coeffs,mode='same')
+
+
+class UniformCubicInterpolation(drx.CubicInterpolation):
+  """
+  Piecewise cubic interpolation (see diffrax.CubicInterpolation) for knots ts that 
+  are uniformly spaced. The interval containing t is found by direct indexing in 
+  O(1) instead of a binary search over ts.
+  """
+  def _interpret_t( self, t, left : bool ):
+    maxlen = self._ts_size() - 2
+    dt = (self.ts[-1] - self.ts[0]) / (self._ts_size() - 1)
+    index = jnp.floor( (t - self.ts[0]) / dt ).astype(int)
+    index = jnp.clip( index, 0, maxlen )
+    fractional_part = t - self.ts[index]
+    return index, fractional_part